@@ -0,0 +1,6 @@
+"""Course tooling for python-data-structures-practice.
+
+Utilities used by maintainers to generate, validate, and grade course
+content. Learners work in the notebooks; nothing here is required to
+complete the exercises.
+"""
@@ -0,0 +1 @@
+"""Interactive assessment tooling."""
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Interactive assessment engine
+
+Runs question banks in the terminal and grades the answers. Supports
+multiple choice, short answer, and code completion questions, mirroring
+the question styles used in the assessment notebooks.
+"""
+
+import ast
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _norm_ast(source):
+    """Canonical AST dump of a code snippet, cached per unique source"""
+    return ast.dump(ast.parse(source, mode="exec"))
+
+
+def _grade_text(norm_correct, student_answer):
+    """Grade text answers (multiple choice letters, short answers)"""
+    return student_answer.lower().strip() == norm_correct
+
+
+def _grade_code(correct_answer, student_code):
+    """Grade code answers structurally, ignoring formatting"""
+    try:
+        return _norm_ast(student_code) == _norm_ast(correct_answer)
+    except SyntaxError:
+        return False
+
+
+_GRADERS = {
+    "multiple_choice": _grade_text,
+    "short_answer": _grade_text,
+    "code_completion": _grade_code,
+}
+
+
+@dataclass
+class Question:
+    """One assessment question"""
+
+    id: str
+    question_type: str  # "multiple_choice", "short_answer", "code_completion"
+    prompt: str
+    correct_answer: str
+    points: int = 1
+    choices: list[str] = field(default_factory=list)
+    # Normalized form of correct_answer, precomputed when the question is
+    # added so grading never re-normalizes it.
+    _norm_correct: str = field(default="", repr=False)
+
+
+class Assessment:
+    """A question bank that can be run interactively and graded"""
+
+    def __init__(self, title):
+        self.title = title
+        self.questions: list[Question] = []
+        self._total_points = 0
+
+    @property
+    def total_points(self):
+        return self._total_points
+
+    def add_question(self, question):
+        """Add a question, precomputing its normalized correct answer"""
+        if question.question_type == "code_completion":
+            # Code answers are compared structurally; keep the source as-is
+            # and let _norm_ast cache the parsed form.
+            question._norm_correct = question.correct_answer
+        else:
+            question._norm_correct = question.correct_answer.lower().strip()
+        self.questions.append(question)
+        self._total_points += question.points
+
+    def run(self):
+        """Ask every question interactively, then print the grade"""
+        print(f"📝 {self.title}")
+        print("=" * 60)
+
+        student_answers = {}
+        for question in self.questions:
+            student_answers[question.id] = self._ask_question(question)
+
+        earned, total = self._grade_assessment(student_answers)
+        print("\n" + "=" * 60)
+        print(f"🎯 Score: {earned}/{total} ({earned / total * 100:.1f}%)")
+        return earned, total
+
+    def _ask_question(self, question):
+        """Prompt for one answer, dispatching on question type"""
+        print(f"\n[{question.points} pt] {question.prompt}")
+        asker = self._ASKERS.get(question.question_type, Assessment._ask_short_answer)
+        return asker(self, question)
+
+    def _ask_multiple_choice(self, question):
+        """Show the lettered choices and collect one letter"""
+        for label, choice in zip("abcd", question.choices):
+            print(f"  {label}) {choice}")
+        return input("Your answer (letter): ")
+
+    def _ask_short_answer(self, question):
+        """Collect a one-line free-form answer"""
+        return input("Your answer: ")
+
+    def _ask_code_completion(self, question):
+        """Collect a multi-line code answer, terminated by a DONE line"""
+        if not sys.stdin.isatty():
+            # Piped input (CI, replay runs): read up to the DONE sentinel,
+            # treating EOF as the end of the answer so truncated input
+            # can never hang the run.
+            lines = []
+            for line in sys.stdin:
+                if line.strip() == "DONE":
+                    break
+                lines.append(line)
+            return "".join(lines).rstrip("\n")
+
+        print("Enter your code, then a line containing only DONE:")
+        lines = []
+        try:
+            while True:
+                line = input()
+                if line.strip() == "DONE":
+                    break
+                lines.append(line)
+        except EOFError:
+            pass
+        return "\n".join(lines)
+
+    def _grade_assessment(self, student_answers):
+        """Score the collected answers against the question bank"""
+        earned = 0
+        for question in self.questions:
+            grader = _GRADERS.get(question.question_type, _grade_text)
+            if grader(question._norm_correct, student_answers.get(question.id, "")):
+                earned += question.points
+        return earned, self._total_points
+
+    _ASKERS = {
+        "multiple_choice": _ask_multiple_choice,
+        "short_answer": _ask_short_answer,
+        "code_completion": _ask_code_completion,
+    }
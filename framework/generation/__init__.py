@@ -0,0 +1 @@
+"""Exercise generation tooling."""
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Exercise generator for course content
+
+Renders a new exercise notebook, solution write-up, and sample data file
+from the templates in framework/templates, numbering the notebook after
+the exercises already present in the target directory.
+
+Usage:
+    python -m framework.generation.exercise_generator config.json [...]
+
+Each config file is a JSON object with "title", "topic" and
+"difficulty_level" keys (plus optional "description", "estimated_time"
+and "output_dir").
+"""
+
+import json
+import mmap
+import os
+import re
+import sys
+from functools import cached_property
+from pathlib import Path
+
+# Compiled once at import time; these run for every generated file.
+# Templates are ASCII, so substitution runs in the regex engine's faster
+# bytes mode and the rendered output is written without a decode/encode
+# round-trip.
+_TEMPLATE_VAR_RE = re.compile(rb"\{([A-Z_][A-Z0-9_]*)\}")
+_MULTI_US_RE = re.compile(r"_+")
+_EX_NUM_RE = re.compile(r"(\d+)_")
+_EXERCISES_SECTION_RE = re.compile(rb"(### .{0,4} Exercises.*?)(\n### |\n## |\Z)", re.DOTALL)
+
+# Translation table for _slugify: lowercase ASCII letters, map spaces to
+# underscores, and delete everything else outside [a-z0-9_] in one pass.
+
+
+class _SlugTable(dict):
+    def __missing__(self, code):
+        # Anything not explicitly kept (including all non-ASCII) is deleted
+        return None
+
+
+_SLUG_TABLE = _SlugTable({code: None for code in range(128)})
+_SLUG_TABLE.update({code: code for code in b"abcdefghijklmnopqrstuvwxyz0123456789_"})
+_SLUG_TABLE.update({code: code + 32 for code in range(ord("A"), ord("Z") + 1)})
+_SLUG_TABLE[ord(" ")] = ord("_")
+
+_VALID_DIFFICULTIES = frozenset({"beginner", "intermediate", "advanced"})
+
+DIFFICULTY_EMOJI = {
+    "beginner": "🟢",
+    "intermediate": "🟡",
+    "advanced": "🔴",
+}
+
+DIFFICULTY_TEXT = {
+    "beginner": "Beginner",
+    "intermediate": "Intermediate",
+    "advanced": "Advanced",
+}
+
+
+class ExerciseGenerator:
+    """Generates exercise notebooks, solutions, and data files from templates"""
+
+    def __init__(self, templates_dir=None):
+        if templates_dir is None:
+            templates_dir = Path(__file__).resolve().parent.parent / "templates"
+        self.templates_dir = Path(templates_dir)
+        self.repo_root = self.templates_dir.parent.parent
+        # Maps output_dir -> (directory mtime_ns, next exercise number)
+        self._numbering_cache: dict[Path, tuple[int, int]] = {}
+
+    # Templates are read once per generator instance; batch runs reuse
+    # the cached text instead of re-opening the same three files.
+
+    @cached_property
+    def exercise_template(self):
+        return (self.templates_dir / "exercise_template.ipynb").read_bytes()
+
+    @cached_property
+    def solution_template(self):
+        return (self.templates_dir / "solution_template.md").read_bytes()
+
+    @cached_property
+    def data_template(self):
+        return (self.templates_dir / "data_template.json").read_bytes()
+
+    def generate_exercise(self, config, output_dir):
+        """Generate one exercise (notebook, solution, data) into output_dir"""
+        self._validate_config(config)
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        text_subs, json_subs = self._prepare_substitutions(config)
+        number = self._get_next_exercise_number(output_dir)
+        outputs = [
+            self._render_notebook(config, json_subs, output_dir, number),
+            self._render_solution(config, text_subs, output_dir, number),
+            self._render_data(config, json_subs),
+        ]
+        self._write_outputs(outputs)
+        notebook_file = outputs[0][0]
+        self._add_to_readme(config, output_dir, notebook_file.name)
+        return notebook_file
+
+    def _validate_config(self, config):
+        """Check that the config has everything the templates need"""
+        for key in ("title", "topic", "difficulty_level"):
+            if not config.get(key):
+                raise ValueError(f"Config is missing required key: {key}")
+
+        level = config["difficulty_level"].lower()
+        if level not in _VALID_DIFFICULTIES:
+            raise ValueError(
+                f"difficulty_level must be one of {sorted(_VALID_DIFFICULTIES)}, "
+                f"got {config['difficulty_level']!r}"
+            )
+
+    def _prepare_substitutions(self, config):
+        """Map template variable names to their UTF-8-encoded values
+
+        Returns a (text, json) pair of substitution dicts. The json
+        variant has each value escaped for splicing into a JSON string,
+        so a title or description containing quotes, backslashes, or
+        newlines cannot render an unloadable notebook or data file.
+        """
+        level = config["difficulty_level"].lower()
+        values = {
+            "EXERCISE_TITLE": config["title"],
+            "TOPIC": config["topic"],
+            "DESCRIPTION": config.get("description", ""),
+            "DIFFICULTY_EMOJI": DIFFICULTY_EMOJI[level],
+            "DIFFICULTY_TEXT": DIFFICULTY_TEXT[level],
+            "ESTIMATED_TIME": str(config.get("estimated_time", 30)),
+            "DATA_FILE": f"{self._slugify(config['title'])}_data.json",
+        }
+        # Encoded once here so substitution and the final writes stay in bytes
+        text_subs = {}
+        json_subs = {}
+        for key, value in values.items():
+            key = key.encode("ascii")
+            text_subs[key] = value.encode("utf-8")
+            # json.dumps without the surrounding quotes == JSON string escaping
+            json_subs[key] = json.dumps(value, ensure_ascii=False)[1:-1].encode("utf-8")
+        return text_subs, json_subs
+
+    def _substitute_variables(self, content, substitutions):
+        """Fill in {VARIABLE} placeholders in template content"""
+
+        def repl(match):
+            # Leave a visible marker for placeholders with no configured value
+            return substitutions.get(match.group(1), b"[TODO: Configure this value]")
+
+        return _TEMPLATE_VAR_RE.sub(repl, content)
+
+    def _slugify(self, text):
+        """Turn an exercise title into a filename-friendly slug"""
+        slug = text.translate(_SLUG_TABLE)
+        slug = _MULTI_US_RE.sub("_", slug)
+        return slug.strip("_")
+
+    def _get_next_exercise_number(self, output_dir):
+        """Find the next free NN_ prefix in output_dir"""
+        mtime = output_dir.stat().st_mtime_ns
+        cached = self._numbering_cache.get(output_dir)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        highest = 0
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".ipynb"):
+                    match = _EX_NUM_RE.match(entry.name)
+                    if match:
+                        highest = max(highest, int(match.group(1)))
+        number = highest + 1
+        self._numbering_cache[output_dir] = (mtime, number)
+        return number
+
+    def _render_notebook(self, config, substitutions, output_dir, number):
+        """Render the exercise notebook from its template"""
+        filename = f"{number:02d}_{self._slugify(config['title'])}.ipynb"
+        content = self._substitute_variables(self.exercise_template, substitutions)
+        return output_dir / filename, content
+
+    def _render_solution(self, config, substitutions, output_dir, number):
+        """Render the matching solution write-up for solutions/<level>/"""
+        filename = f"{number:02d}_{self._slugify(config['title'])}_solutions.md"
+        content = self._substitute_variables(self.solution_template, substitutions)
+
+        solutions_dir = self.repo_root / "solutions" / output_dir.name
+        solutions_dir.mkdir(parents=True, exist_ok=True)
+        return solutions_dir / filename, content
+
+    def _render_data(self, config, substitutions):
+        """Render the sample data file for data/"""
+        content = self._substitute_variables(self.data_template, substitutions)
+
+        data_dir = self.repo_root / "data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        return data_dir / substitutions[b"DATA_FILE"].decode("ascii"), content
+
+    def _write_outputs(self, outputs):
+        """Write all rendered (path, content) pairs in one batched phase"""
+        # Rendering is kept separate from I/O so every file for an
+        # exercise hits the disk back-to-back in a single tight loop.
+        for path, content in outputs:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, content)
+            finally:
+                os.close(fd)
+
+    def _add_to_readme(self, config, output_dir, filename):
+        """List the new exercise in the per-directory README"""
+        emoji = DIFFICULTY_EMOJI[config["difficulty_level"].lower()]
+        new_line = f"- `{filename}` - {config['title']}".encode("utf-8")
+        readme_file = output_dir / "README.md"
+
+        if not readme_file.exists() or readme_file.stat().st_size == 0:
+            readme_file.write_bytes(
+                f"# {output_dir.name.title()}\n\n### {emoji} Exercises\n\n".encode("utf-8")
+                + new_line
+                + b"\n"
+            )
+            return
+
+        # Splice the new line into the exercises section in place instead of
+        # round-tripping the whole README through a Python string.
+        with open(readme_file, "r+b") as f:
+            inserted = False
+            with mmap.mmap(f.fileno(), 0) as mm:
+                match = _EXERCISES_SECTION_RE.search(mm)
+                if match:
+                    insert_at = match.end(1)
+                    if mm[insert_at - 1 : insert_at] == b"\n":
+                        chunk = new_line + b"\n"
+                    else:
+                        chunk = b"\n" + new_line
+                    old_size = mm.size()
+                    mm.resize(old_size + len(chunk))
+                    mm.move(insert_at + len(chunk), insert_at, old_size - insert_at)
+                    mm[insert_at : insert_at + len(chunk)] = chunk
+                    mm.flush()
+                    inserted = True
+            if not inserted:
+                # No exercises section yet; start one at the end
+                f.seek(0, os.SEEK_END)
+                f.write(f"\n### {emoji} Exercises\n\n".encode("utf-8") + new_line + b"\n")
+
+
+def main():
+    """Generate an exercise for each config file passed on the command line"""
+    if len(sys.argv) < 2:
+        print("Usage: python -m framework.generation.exercise_generator config.json [...]")
+        return 1
+
+    generator = ExerciseGenerator()
+    for config_path in sys.argv[1:]:
+        config = json.loads(Path(config_path).read_text(encoding="utf-8"))
+        output_dir = config.get("output_dir", "basics")
+        notebook_file = generator.generate_exercise(config, output_dir)
+        print(f"✅ Generated {notebook_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Content validation tooling."""
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Content validator for course notebooks and solutions
+
+Checks notebook structure, ADHD-friendly design guidelines, and code
+quality conventions across the course directories, then writes a
+markdown validation report.
+
+Usage:
+    python -m framework.validation.content_validator
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from itertools import chain
+from pathlib import Path
+from types import SimpleNamespace
+
+# Compiled once at import time; these run for every cell of every notebook.
+_HEADER_RE = re.compile(r"^#+\s", re.MULTILINE)
+_EXERCISE_RE = re.compile(r"##\s*Exercise\s*\d+", re.IGNORECASE)
+_REQUIRED_SECTIONS = ("# Solutions", "## Exercise", "### Solution")
+_RECOMMENDED_SECTIONS = (
+    "### Key Concepts",
+    "### Alternative Approaches",
+    "### Common Mistakes",
+)
+# One alternation over every marker validate_solution cares about, so the
+# file content is scanned once rather than once per marker.
+_SECTION_MARKER_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in _REQUIRED_SECTIONS + _RECOMMENDED_SECTIONS + ("```python",)
+    )
+)
+
+NOTEBOOK_DIRS = ("basics", "intermediate", "advanced", "assessments")
+
+# Cell type tags are interned once here and once per cell in _adapt_cells,
+# so the per-cell dispatch below is a pointer comparison.
+_CODE = sys.intern("code")
+_MARKDOWN = sys.intern("markdown")
+
+# CI and pre-commit re-run validation constantly; results are cached per
+# file-content hash so only changed files pay for a fresh validation.
+_CACHE_FILE = Path(".validation_cache.json")
+
+
+def _adapt_cells(nb_raw):
+    """Wrap raw notebook JSON cells so the checks can use attribute access"""
+    cells = []
+    for cell in nb_raw.get("cells", []):
+        source = cell.get("source", "")
+        if isinstance(source, list):
+            source = "".join(source)
+        cells.append(
+            SimpleNamespace(cell_type=sys.intern(cell.get("cell_type", "")), source=source)
+        )
+    return cells
+
+
+def _has_python_code_block(content):
+    """True when content has a complete ```python ... ``` fence.
+
+    Parsed with str.find rather than a non-greedy regex so degenerate
+    inputs (an opener with no closer and many stray backticks) stay
+    linear instead of backtracking.
+    """
+    start = content.find("```python\n")
+    if start == -1:
+        return False
+    return content.find("\n```", start + len("```python\n")) != -1
+
+
+def _contains_emoji(text):
+    """True when text has a character in the emoji / symbol ranges"""
+    for char in text:
+        code = ord(char)
+        if 0x1F300 <= code <= 0x1FAFF or 0x2600 <= code <= 0x27BF:
+            return True
+    return False
+
+
+def _is_word_char(char):
+    return char == "_" or char.isalnum()
+
+
+def _scan_code_cell(code):
+    """One pass over a code cell's source
+
+    Returns (has_todo, has_print, has_short_var), fusing the TODO probe,
+    the print( probe, and the single-letter assignment detection
+    (equivalent to \\b[a-z]\\b\\s*=) so the cell is only walked once.
+    """
+    has_todo = False
+    has_print = False
+    has_short_var = False
+    length = len(code)
+    for index in range(length):
+        char = code[index]
+        if not has_todo and char == "T" and code[index : index + 4] == "TODO":
+            has_todo = True
+        elif not has_print and char == "p" and code[index : index + 6] == "print(":
+            has_print = True
+        if (
+            not has_short_var
+            and "a" <= char <= "z"
+            and not (index and _is_word_char(code[index - 1]))
+        ):
+            after = index + 1
+            if not (after < length and _is_word_char(code[after])):
+                while after < length and code[after].isspace():
+                    after += 1
+                if after < length and code[after] == "=":
+                    has_short_var = True
+        if has_todo and has_print and has_short_var:
+            break
+    return has_todo, has_print, has_short_var
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating one file"""
+
+    is_valid: bool
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    suggestions: list[str] = field(default_factory=list)
+    # True when the file is too broken for the remaining checks to mean
+    # anything (unparseable, or failed the basic structure check).
+    fatal: bool = False
+
+
+class ContentValidator:
+    """Validates notebooks and solution files against course guidelines"""
+
+    def __init__(self):
+        self.adhd_guidelines = {
+            "max_cell_lines": 15,
+            "min_exercises": 2,
+            "max_exercises": 6,
+        }
+
+    def validate_notebook(self, notebook_path, strict=False):
+        """Validate one exercise notebook"""
+        try:
+            raw = Path(notebook_path).read_bytes()
+        except OSError as exc:
+            return ValidationResult(
+                False, errors=[f"Failed to read notebook: {exc}"], fatal=True
+            )
+        return self.validate_notebook_from_bytes(raw, strict=strict)
+
+    def validate_notebook_from_bytes(self, raw, strict=False):
+        """Validate a notebook already loaded as bytes
+
+        Callers that touch the file for other reasons (content hashing)
+        pass the bytes straight in so the file is only read once. The
+        checks only need cell_type and source, so the notebook is parsed
+        with plain json by default; pass strict=True (--strict on the
+        command line) to run nbformat's full schema validation too.
+        """
+        try:
+            if strict:
+                import nbformat
+
+                # NotebookNode is a dict subclass, so the adapter
+                # normalizes these cells too
+                cells = _adapt_cells(nbformat.reads(raw.decode("utf-8"), as_version=4))
+            else:
+                cells = _adapt_cells(json.loads(raw))
+        except Exception as exc:
+            return ValidationResult(
+                False, errors=[f"Failed to parse notebook: {exc}"], fatal=True
+            )
+
+        # Split the cells once; every check works from these lists instead
+        # of re-walking the cell list itself.
+        code_cells = []
+        markdown_cells = []
+        for cell in cells:
+            if cell.cell_type is _CODE:
+                code_cells.append(cell)
+            elif cell.cell_type is _MARKDOWN:
+                markdown_cells.append(cell)
+
+        # The checks append straight into shared lists; no per-check
+        # ValidationResult to build and merge.
+        errors = []
+        warnings = []
+        suggestions = []
+        fatal = self._check_notebook_structure(
+            cells, code_cells, markdown_cells, errors, warnings, suggestions
+        )
+        if fatal:
+            # A stub notebook (too few cells, no code) would only drown the
+            # structural errors in noise from the remaining checks.
+            return ValidationResult(False, errors, warnings, suggestions, fatal=True)
+        self._check_adhd_friendly_design(cells, errors, warnings, suggestions)
+        self._check_code_quality(code_cells, errors, warnings, suggestions)
+        return ValidationResult(not errors, errors, warnings, suggestions)
+
+    def _check_notebook_structure(
+        self, cells, code_cells, markdown_cells, errors, warnings, suggestions
+    ):
+        """Basic shape: enough cells, code present, markdown intro first
+
+        Returns True when the notebook fails so fundamentally that the
+        design and code-quality checks are not worth running.
+        """
+        fatal = False
+        if len(cells) < 3:
+            errors.append("Notebook must have at least 3 cells")
+            fatal = True
+        if not code_cells:
+            errors.append("Notebook must include code cells")
+            fatal = True
+        if not markdown_cells:
+            warnings.append("Notebook has no markdown cells for instructions")
+        if cells and cells[0].cell_type is not _MARKDOWN:
+            warnings.append("First cell should be a markdown title")
+        return fatal
+
+    def _check_adhd_friendly_design(self, cells, errors, warnings, suggestions):
+        """ADHD guidelines: short cells, clear headers, visual anchors"""
+        max_lines = self.adhd_guidelines["max_cell_lines"]
+
+        has_headers = False
+        has_emoji = False
+        exercise_count = 0
+        for index, cell in enumerate(cells):
+            source = cell.source
+            # Same value as len(source.split("\n")) without the list of substrings
+            lines = source.count("\n") + 1
+            if lines > max_lines:
+                warnings.append(
+                    f"Cell {index} has {lines} lines (guideline: max {max_lines})"
+                )
+            if cell.cell_type is not _MARKDOWN:
+                continue
+            if not has_headers and _HEADER_RE.search(source):
+                has_headers = True
+            if not has_emoji and _contains_emoji(source):
+                has_emoji = True
+            exercise_count += len(_EXERCISE_RE.findall(source))
+
+        if not has_headers:
+            warnings.append("No markdown headers found; add section structure")
+        if not has_emoji:
+            suggestions.append("Add emoji visual anchors (🟢 💡 ⚠️) for scannability")
+        if exercise_count < self.adhd_guidelines["min_exercises"]:
+            suggestions.append(
+                f"Only {exercise_count} exercises found; aim for at least "
+                f"{self.adhd_guidelines['min_exercises']}"
+            )
+        elif exercise_count > self.adhd_guidelines["max_exercises"]:
+            suggestions.append(
+                f"{exercise_count} exercises may be too many for one session; "
+                f"consider splitting the notebook"
+            )
+
+    def _check_code_quality(self, code_cells, errors, warnings, suggestions):
+        """Code cell conventions: TODO placeholders, printed output, naming"""
+        for index, cell in enumerate(code_cells):
+            has_todo, has_print, has_short_var = _scan_code_cell(cell.source)
+            if not has_todo and not has_print:
+                suggestions.append(
+                    f"Code cell {index} has neither a TODO placeholder nor printed "
+                    f"output; learners need visible feedback"
+                )
+            if has_short_var:
+                warnings.append(
+                    f"Code cell {index} assigns single-letter variable names; "
+                    f"use descriptive names in examples"
+                )
+
+    def validate_solution(self, solution_path):
+        """Validate one solution write-up"""
+        try:
+            raw = Path(solution_path).read_bytes()
+        except OSError as exc:
+            return ValidationResult(False, errors=[f"Failed to read solution: {exc}"])
+        return self.validate_solution_from_bytes(raw)
+
+    def validate_solution_from_bytes(self, raw):
+        """Validate a solution write-up already loaded as bytes"""
+        try:
+            content = raw.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            return ValidationResult(False, errors=[f"Failed to read solution: {exc}"])
+
+        errors, warnings, suggestions = [], [], []
+
+        seen = set()
+        for match in _SECTION_MARKER_RE.finditer(content):
+            seen.add(match.group())
+
+        for section in _REQUIRED_SECTIONS:
+            if section not in seen:
+                errors.append(f"Missing required section: {section}")
+        for section in _RECOMMENDED_SECTIONS:
+            if section not in seen:
+                suggestions.append(f"Consider adding a {section} section")
+
+        # Cheap guard first; only parse fences when an opener exists
+        if "```python" not in seen or not _has_python_code_block(content):
+            errors.append("No python code blocks found")
+        return ValidationResult(not errors, errors, warnings, suggestions)
+
+    def generate_report(self, results):
+        """Yield markdown report lines for the validation run
+
+        A generator so the caller can stream lines straight to the report
+        file; files that pass with nothing to say only show up in the
+        summary counts.
+        """
+        total = len(results)
+        passed = sum(1 for result in results.values() if result.is_valid)
+        yield "# Content Validation Report"
+        yield ""
+        yield f"**Files checked**: {total}  "
+        yield f"**Passed**: {passed}  "
+        yield f"**Failed**: {total - passed}"
+        yield ""
+        for path, result in results.items():
+            if result.is_valid and not (result.warnings or result.suggestions):
+                continue
+            status = "✅" if result.is_valid else "❌"
+            yield f"## {status} {path}"
+            yield ""
+            for error in result.errors:
+                yield f"- ❌ {error}"
+            for warning in result.warnings:
+                yield f"- ⚠️ {warning}"
+            for suggestion in result.suggestions:
+                yield f"- 💡 {suggestion}"
+            yield ""
+
+
+def main():
+    """Validate all course notebooks and solutions, then write the report"""
+    strict = "--strict" in sys.argv[1:]
+    validator = ContentValidator()
+    results = {}
+
+    notebooks = []
+    for directory in NOTEBOOK_DIRS:
+        for notebook in Path(directory).glob("*.ipynb"):
+            if notebook.name.startswith("."):
+                continue
+            notebooks.append(notebook)
+    solutions = [
+        solution
+        for solution in Path("solutions").glob("**/*.md")
+        if not solution.name.startswith(".")
+    ]
+
+    cache = {}
+    if _CACHE_FILE.exists():
+        try:
+            cache = json.loads(_CACHE_FILE.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            cache = {}
+
+    # The key covers the file bytes plus everything else that can change
+    # the outcome: the guidelines and the strict flag.
+    guidelines_tag = json.dumps(validator.adhd_guidelines, sort_keys=True).encode("utf-8")
+
+    def file_key(raw):
+        digest = hashlib.sha256(raw)
+        digest.update(guidelines_tag)
+        if strict:
+            digest.update(b"strict")
+        return digest.hexdigest()
+
+    # Each file is read once; cache misses hand the same bytes on to the
+    # validators instead of re-opening the file.
+    keys = {}
+    hits = {}
+    raws = {}
+    pending_notebooks = []
+    pending_solutions = []
+    for file_list, pending in (
+        (notebooks, pending_notebooks),
+        (solutions, pending_solutions),
+    ):
+        for file_path in file_list:
+            raw = file_path.read_bytes()
+            key = keys[str(file_path)] = file_key(raw)
+            if key in cache:
+                hits[str(file_path)] = ValidationResult(**cache[key])
+            else:
+                pending.append(file_path)
+                raws[str(file_path)] = raw
+
+    # Each file is validated independently, so fan the CPU-bound work out
+    # across cores; the validator holds no per-run state.
+    fresh = {}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        notebook_results = executor.map(
+            partial(validator.validate_notebook_from_bytes, strict=strict),
+            [raws[str(path)] for path in pending_notebooks],
+            chunksize=4,
+        )
+        solution_results = executor.map(
+            validator.validate_solution_from_bytes,
+            [raws[str(path)] for path in pending_solutions],
+            chunksize=4,
+        )
+        for path, result in zip(pending_notebooks, notebook_results):
+            fresh[str(path)] = result
+        for path, result in zip(pending_solutions, solution_results):
+            fresh[str(path)] = result
+
+    for path in chain(notebooks, solutions):
+        name = str(path)
+        results[name] = hits[name] if name in hits else fresh[name]
+
+    # Persist atomically, keeping only keys for files that still exist
+    new_cache = {keys[name]: asdict(result) for name, result in results.items()}
+    cache_tmp = _CACHE_FILE.with_suffix(".json.tmp")
+    cache_tmp.write_text(json.dumps(new_cache), encoding="utf-8")
+    os.replace(cache_tmp, _CACHE_FILE)
+
+    with open("validation_report.md", "w", encoding="utf-8") as report_file:
+        for line in validator.generate_report(results):
+            report_file.write(line)
+            report_file.write("\n")
+
+    failed = [path for path, result in results.items() if not result.is_valid]
+    print(f"Checked {len(results)} files; {len(failed)} failed")
+    for path in failed:
+        print(f"❌ {path}")
+    print("📄 Full report: validation_report.md")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,26 +7,56 @@ Tests both pip and uv package managers
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_command(cmd, description):
-    """Run a command and return success status"""
-    print(f"\n🔍 {description}")
-    print(f"Command: {' '.join(cmd)}")
-    
+_TAIL_LIMIT = 4096  # keep only the last ~4 KB of output for the report
+
+def _read_tail(stream, limit=_TAIL_LIMIT):
+    """Consume a stream incrementally, retaining only the last limit chars"""
+    tail = ""
+    if stream is None:
+        return tail
+    for line in stream:
+        tail = (tail + line)[-limit:]
+    return tail
+
+def run_command(cmd):
+    """Run a command and return (success, status, detail)"""
+    # Dry-run installs can emit megabytes; only their exit status matters,
+    # so discard that output instead of buffering it.
+    wants_output = "--dry-run" not in cmd
+    stdout = subprocess.PIPE if wants_output else subprocess.DEVNULL
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        print("✅ SUCCESS")
-        if result.stdout.strip():
-            print(f"Output: {result.stdout.strip()}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print("❌ FAILED")
-        print(f"Error: {e.stderr.strip()}")
-        return False
+        proc = subprocess.Popen(cmd, stdout=stdout, stderr=subprocess.PIPE, text=True)
     except FileNotFoundError:
-        print("❌ COMMAND NOT FOUND")
-        return False
+        return False, "❌ COMMAND NOT FOUND", ""
+
+    out_tail = _read_tail(proc.stdout)
+    err_tail = _read_tail(proc.stderr)
+    if proc.wait() == 0:
+        return True, "✅ SUCCESS", out_tail.strip()
+    return False, "❌ FAILED", err_tail.strip()
+
+def report_test_group(title, tests, futures):
+    """Print one group's results in order and return its pass count"""
+    print("\n" + "=" * 60)
+    print(title)
+    print("=" * 60)
+
+    passed = 0
+    for cmd, description in tests:
+        success, status, detail = futures[id(cmd)].result()
+        print(f"\n🔍 {description}")
+        print(f"Command: {' '.join(cmd)}")
+        print(status)
+        if success and detail:
+            print(f"Output: {detail}")
+        elif not success and detail:
+            print(f"Error: {detail}")
+        if success:
+            passed += 1
+    return passed
 
 def main():
     """Main verification function"""
@@ -45,11 +75,6 @@ def main():
     if python_version < (3, 12):
         print("⚠️  WARNING: Python 3.12+ is required by this project")
     
-    # Test uv commands
-    print("\n" + "=" * 60)
-    print("TESTING UV PACKAGE MANAGER")
-    print("=" * 60)
-    
     uv_tests = [
         (["uv", "--version"], "Check uv version"),
         (["uv", "pip", "install", "--dry-run", "-r", "requirements.txt"], "Test requirements.txt with uv"),
@@ -57,47 +82,33 @@ def main():
         (["uv", "sync", "--dry-run", "--extra", "dev"], "Test dev dependencies with uv"),
         (["uv", "sync", "--dry-run", "--extra", "enhanced"], "Test enhanced dependencies with uv"),
     ]
-    
-    uv_success = 0
-    for cmd, desc in uv_tests:
-        if run_command(cmd, desc):
-            uv_success += 1
-    
-    print(f"\n📊 UV Tests: {uv_success}/{len(uv_tests)} passed")
-    
-    # Test pip commands (if available)
-    print("\n" + "=" * 60)
-    print("TESTING PIP COMPATIBILITY")
-    print("=" * 60)
-    
+
     pip_tests = [
         (["pip", "--version"], "Check pip version"),
         (["pip", "install", "--dry-run", "-r", "requirements.txt"], "Test requirements.txt with pip"),
     ]
-    
-    pip_success = 0
-    for cmd, desc in pip_tests:
-        if run_command(cmd, desc):
-            pip_success += 1
-    
-    print(f"\n📊 PIP Tests: {pip_success}/{len(pip_tests)} passed")
-    
-    # Test Jupyter functionality
-    print("\n" + "=" * 60)
-    print("TESTING JUPYTER FUNCTIONALITY")
-    print("=" * 60)
-    
+
     jupyter_tests = [
         (["jupyter", "--version"], "Check Jupyter installation"),
         (["jupyter", "kernelspec", "list"], "List available kernels"),
     ]
-    
-    jupyter_success = 0
-    for cmd, desc in jupyter_tests:
-        if run_command(cmd, desc):
-            jupyter_success += 1
-    
-    print(f"\n📊 Jupyter Tests: {jupyter_success}/{len(jupyter_tests)} passed")
+
+    # The checks are independent subprocesses (the uv dry-runs take
+    # seconds each), so spawn them all at once and report in order.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {}
+        for tests in (uv_tests, pip_tests, jupyter_tests):
+            for cmd, desc in tests:
+                futures[id(cmd)] = executor.submit(run_command, cmd)
+
+        uv_success = report_test_group("TESTING UV PACKAGE MANAGER", uv_tests, futures)
+        print(f"\n📊 UV Tests: {uv_success}/{len(uv_tests)} passed")
+
+        pip_success = report_test_group("TESTING PIP COMPATIBILITY", pip_tests, futures)
+        print(f"\n📊 PIP Tests: {pip_success}/{len(pip_tests)} passed")
+
+        jupyter_success = report_test_group("TESTING JUPYTER FUNCTIONALITY", jupyter_tests, futures)
+        print(f"\n📊 Jupyter Tests: {jupyter_success}/{len(jupyter_tests)} passed")
     
     # Summary
     print("\n" + "=" * 60)